@@ -0,0 +1,114 @@
+import { expect } from "@jest/globals";
+
+import type * as libsql from "../wasm.js";
+import { createClient } from "../wasm.js";
+
+function withInMemoryClient(
+    f: (c: libsql.Client) => Promise<void>,
+): () => Promise<void> {
+    return async () => {
+        const c = createClient({ url: ":memory:" });
+        try {
+            await f(c);
+        } finally {
+            c.close();
+        }
+    };
+}
+
+describe("statement cache", () => {
+    test(
+        "repeated statement with different arguments",
+        withInMemoryClient(async (c) => {
+            for (let i = 0; i < 3; ++i) {
+                const rs = await c.execute({ sql: "SELECT ?", args: [i] });
+                expect(Array.from(rs.rows[0])).toStrictEqual([i]);
+            }
+        }),
+    );
+
+    test(
+        "repeated statement with fewer positional arguments",
+        withInMemoryClient(async (c) => {
+            const rs1 = await c.execute({
+                sql: "SELECT ?",
+                args: ["secret"],
+            });
+            expect(Array.from(rs1.rows[0])).toStrictEqual(["secret"]);
+
+            const rs2 = await c.execute("SELECT ?");
+            expect(Array.from(rs2.rows[0])).toStrictEqual([null]);
+        }),
+    );
+
+    test(
+        "repeated statement with named arguments",
+        withInMemoryClient(async (c) => {
+            for (let i = 0; i < 2; ++i) {
+                const rs = await c.execute({
+                    sql: "SELECT :a",
+                    args: { a: i },
+                });
+                expect(Array.from(rs.rows[0])).toStrictEqual([i]);
+            }
+        }),
+    );
+
+    for (const sign of [":", "@", "$"]) {
+        test(
+            `repeated statement with ${sign}AAAA arguments`,
+            withInMemoryClient(async (c) => {
+                for (let i = 0; i < 2; ++i) {
+                    const rs = await c.execute({
+                        sql: `SELECT ${sign}b, ${sign}a`,
+                        args: { a: i, [`${sign}b`]: "two" },
+                    });
+                    expect(Array.from(rs.rows[0])).toStrictEqual(["two", i]);
+                }
+            }),
+        );
+    }
+
+    test(
+        "repeated statement after a schema change",
+        withInMemoryClient(async (c) => {
+            await c.batch(["CREATE TABLE t (a)", "INSERT INTO t VALUES (1)"]);
+
+            const rs1 = await c.execute("SELECT * FROM t");
+            expect(rs1.columns).toStrictEqual(["a"]);
+
+            await c.execute("ALTER TABLE t ADD COLUMN b");
+            const rs2 = await c.execute("SELECT * FROM t");
+            expect(rs2.columns).toStrictEqual(["a", "b"]);
+            expect(Array.from(rs2.rows[0])).toStrictEqual([1, null]);
+        }),
+    );
+
+    test(
+        "repeated statement after a failed execution",
+        withInMemoryClient(async (c) => {
+            await c.execute("CREATE TABLE t (a UNIQUE)");
+            const sql = "INSERT INTO t VALUES (?)";
+            await c.execute({ sql, args: [1] });
+            await expect(c.execute({ sql, args: [1] })).rejects.toThrow();
+
+            const rs = await c.execute({ sql, args: [2] });
+            expect(rs.rowsAffected).toStrictEqual(1);
+        }),
+    );
+
+    test(
+        "repeated statement after an invalid argument",
+        withInMemoryClient(async (c) => {
+            const rs1 = await c.execute({ sql: "SELECT ?", args: [1] });
+            expect(Array.from(rs1.rows[0])).toStrictEqual([1]);
+
+            await expect(
+                c.execute({ sql: "SELECT ?", args: [NaN] }),
+            ).rejects.toThrow(RangeError);
+
+            const rs2 = await c.execute({ sql: "SELECT ?", args: [2] });
+            expect(Array.from(rs2.rows[0])).toStrictEqual([2]);
+        }),
+    );
+});
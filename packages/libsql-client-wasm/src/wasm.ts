@@ -26,7 +26,10 @@ import {
     supportedUrlLink,
     transactionModeToBegin,
     ResultSetImpl,
+    intFromSqlForMode,
+    Lru,
 } from "@libsql/core/util";
+import type { IntFromSql } from "@libsql/core/util";
 
 export * from "@libsql/core/api";
 
@@ -182,6 +185,8 @@ export class Sqlite3Client implements Client {
     close(): void {
         this.closed = true;
         if (this.#db !== null) {
+            // drop the cached statements together with the connection
+            stmtCaches.delete(this.#db);
             this.#db.close();
         }
     }
@@ -278,17 +283,13 @@ function executeStmt(
         } else {
             args = {};
             for (const name in stmt.args) {
-                const argName =
-                    name[0] === "@" || name[0] === "$" || name[0] === ":"
-                        ? name.substring(1)
-                        : name;
-                args[argName] = valueToSql(stmt.args[name], intMode);
+                args[name] = valueToSql(stmt.args[name], intMode);
             }
         }
     }
 
     try {
-        const sqlStmt = db.prepare(sql);
+        const sqlStmt = prepareStmt(db, sql);
 
         // TODO: sqlStmt.safeIntegers(true);
 
@@ -300,23 +301,25 @@ function executeStmt(
                 sqlStmt.bind(i + 1, value);
             }
         } else {
-            for (const argName in args) {
-                const idx = sqlStmt.getParamIndex(argName)!;
-                const value = args[argName];
+            for (const name in args) {
+                const idx = paramIndex(sqlStmt, name);
+                const value = args[name];
                 sqlStmt.bind(idx, value);
             }
         }
         if (returnsData) {
-            let columns: string[] = sqlStmt.getColumnNames();
-            let columnTypes: string[] = [];
-            let rows: Row[] = [];
-            for (;;) {
-                if (!sqlStmt.step()) {
-                    break;
-                }
-                const values: unknown[] = sqlStmt.get([]);
-                rows.push(rowFromSql(values, columns, intMode));
+            const sqlRows: Array<Array<unknown>> = [];
+            while (sqlStmt.step()) {
+                sqlRows.push(sqlStmt.get([]));
             }
+            // A cached statement is recompiled by SQLite when the schema changes, so we must read the columns
+            // only after the statement has been executed.
+            const columns: string[] = sqlStmt.getColumnNames();
+            const columnTypes: string[] = [];
+            const intFromSql = intFromSqlForMode(intMode);
+            const rows: Row[] = sqlRows.map((sqlRow) => {
+                return rowFromSql(sqlRow, columns, intFromSql);
+            });
             const rowsAffected = 0;
             const lastInsertRowid = undefined;
             return new ResultSetImpl(
@@ -333,58 +336,123 @@ function executeStmt(
             return new ResultSetImpl([], [], [], rowsAffected, lastInsertRowid);
         }
     } catch (e) {
+        // `reset()` throws the error of the last step again, so a statement that failed must not be reused
+        uncacheStmt(db, sql);
         throw mapSqliteError(e);
     }
 }
 
+type Statement = ReturnType<Database["prepare"]>;
+
+// Prepared statements of every database connection, keyed by the SQL text. Preparing a statement parses and
+// plans the SQL, which dominates the cost of executing short statements, so we reuse the prepared statement
+// when the same SQL is executed again on the same connection.
+const stmtCaches: WeakMap<Database, Lru<string, Statement>> = new WeakMap();
+const stmtCacheCapacity = 100;
+
+function prepareStmt(db: Database, sql: string): Statement {
+    let stmtCache = stmtCaches.get(db);
+    if (stmtCache === undefined) {
+        stmtCache = new Lru();
+        stmtCaches.set(db, stmtCache);
+    }
+
+    let sqlStmt = stmtCache.get(sql);
+    if (sqlStmt !== undefined) {
+        // clear the bindings of the previous execution
+        sqlStmt.reset(true);
+    } else {
+        sqlStmt = db.prepare(sql);
+        while (stmtCache.size + 1 > stmtCacheCapacity) {
+            const [evictSql, evictStmt] = stmtCache.peekLru()!;
+            stmtCache.delete(evictSql);
+            evictStmt.finalize();
+        }
+        stmtCache.set(sql, sqlStmt);
+    }
+    return sqlStmt;
+}
+
+// Indexes of the named parameters of every prepared statement, keyed by the argument name as passed by the
+// user. A cached statement is executed many times with the same argument names, so we look up each index
+// only once.
+const paramIndexes: WeakMap<Statement, Map<string, number>> = new WeakMap();
+
+function paramIndex(sqlStmt: Statement, name: string): number {
+    let indexes = paramIndexes.get(sqlStmt);
+    if (indexes === undefined) {
+        indexes = new Map();
+        paramIndexes.set(sqlStmt, indexes);
+    }
+
+    let idx = indexes.get(name);
+    if (idx === undefined) {
+        if (name[0] === "@" || name[0] === "$" || name[0] === ":") {
+            idx = sqlStmt.getParamIndex(name) ?? 0;
+        } else {
+            // SQLite looks up a parameter by its full name, including the prefix, so we must find out which
+            // prefix the parameter uses in the SQL text
+            idx = 0;
+            for (const prefix of [":", "@", "$"]) {
+                idx = sqlStmt.getParamIndex(prefix + name) ?? 0;
+                if (idx !== 0) {
+                    break;
+                }
+            }
+        }
+        indexes.set(name, idx);
+    }
+    return idx;
+}
+
+function uncacheStmt(db: Database, sql: string): void {
+    const stmtCache = stmtCaches.get(db);
+    const sqlStmt = stmtCache?.get(sql);
+    if (stmtCache !== undefined && sqlStmt !== undefined) {
+        stmtCache.delete(sql);
+        sqlStmt.finalize();
+    }
+}
+
 function rowFromSql(
     sqlRow: Array<unknown>,
     columns: Array<string>,
-    intMode: IntMode,
+    intFromSql: IntFromSql,
 ): Row {
     const row = {};
     // make sure that the "length" property is not enumerable
     Object.defineProperty(row, "length", { value: sqlRow.length });
+
+    // defineProperty() reads the descriptor when it is called, so we can reuse the same descriptor objects for
+    // all values in the row instead of allocating two of them for every value
+    const indexDesc: PropertyDescriptor = { value: undefined };
+    const columnDesc: PropertyDescriptor = {
+        value: undefined,
+        enumerable: true,
+        configurable: true,
+        writable: true,
+    };
     for (let i = 0; i < sqlRow.length; ++i) {
-        const value = valueFromSql(sqlRow[i], intMode);
-        Object.defineProperty(row, i, { value });
+        const value = valueFromSql(sqlRow[i], intFromSql);
+        indexDesc.value = value;
+        Object.defineProperty(row, i, indexDesc);
 
         const column = columns[i];
         if (!Object.hasOwn(row, column)) {
-            Object.defineProperty(row, column, {
-                value,
-                enumerable: true,
-                configurable: true,
-                writable: true,
-            });
+            columnDesc.value = value;
+            Object.defineProperty(row, column, columnDesc);
         }
     }
     return row as Row;
 }
 
-function valueFromSql(sqlValue: unknown, intMode: IntMode): Value {
+function valueFromSql(sqlValue: unknown, intFromSql: IntFromSql): Value {
     if (typeof sqlValue === "bigint") {
-        if (intMode === "number") {
-            if (sqlValue < minSafeBigint || sqlValue > maxSafeBigint) {
-                throw new RangeError(
-                    "Received integer which cannot be safely represented as a JavaScript number",
-                );
-            }
-            return Number(sqlValue);
-        } else if (intMode === "bigint") {
-            return sqlValue;
-        } else if (intMode === "string") {
-            return "" + sqlValue;
-        } else {
-            throw new Error("Invalid value for IntMode");
-        }
+        return intFromSql(sqlValue);
     }
     return sqlValue as Value;
 }
 
-const minSafeBigint = -9007199254740991n;
-const maxSafeBigint = 9007199254740991n;
-
 function valueToSql(value: InValue, intMode: IntMode): SqlValue {
     if (typeof value === "number") {
         if (!Number.isFinite(value)) {
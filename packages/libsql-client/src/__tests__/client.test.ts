@@ -251,6 +251,86 @@ describe("execute()", () => {
         }),
     );
 
+    test(
+        "repeated statement with different arguments",
+        withClient(async (c) => {
+            for (let i = 0; i < 3; ++i) {
+                const rs = await c.execute({ sql: "SELECT ?", args: [i] });
+                expect(Array.from(rs.rows[0])).toStrictEqual([i]);
+            }
+        }),
+    );
+
+    (isFile ? test : test.skip)(
+        "repeated statement with fewer positional arguments",
+        withClient(async (c) => {
+            const rs1 = await c.execute({
+                sql: "SELECT ?",
+                args: ["secret"],
+            });
+            expect(Array.from(rs1.rows[0])).toStrictEqual(["secret"]);
+
+            const rs2 = await c.execute("SELECT ?");
+            expect(Array.from(rs2.rows[0])).toStrictEqual([null]);
+        }),
+    );
+
+    (isFile ? test : test.skip)(
+        "repeated statement with fewer named arguments",
+        withClient(async (c) => {
+            const sql = "SELECT :a, :b";
+            const rs1 = await c.execute({
+                sql,
+                args: { a: 1, b: "secret" },
+            });
+            expect(Array.from(rs1.rows[0])).toStrictEqual([1, "secret"]);
+
+            const rs2 = await c.execute({ sql, args: { a: 2 } });
+            expect(Array.from(rs2.rows[0])).toStrictEqual([2, null]);
+        }),
+    );
+
+    test(
+        "repeated statement after a schema change",
+        withClient(async (c) => {
+            await c.batch(
+                [
+                    "DROP TABLE IF EXISTS t",
+                    "CREATE TABLE t (a)",
+                    "INSERT INTO t VALUES (1)",
+                ],
+                "write",
+            );
+
+            const rs1 = await c.execute("SELECT * FROM t");
+            expect(rs1.columns).toStrictEqual(["a"]);
+
+            await c.execute("ALTER TABLE t ADD COLUMN b");
+            const rs2 = await c.execute("SELECT * FROM t");
+            expect(rs2.columns).toStrictEqual(["a", "b"]);
+            expect(Array.from(rs2.rows[0])).toStrictEqual([1, null]);
+        }),
+    );
+
+    test(
+        "repeated statement after a failed execution",
+        withClient(async (c) => {
+            await c.batch(
+                ["DROP TABLE IF EXISTS t", "CREATE TABLE t (a UNIQUE)"],
+                "write",
+            );
+
+            const sql = "INSERT INTO t VALUES (?)";
+            await c.execute({ sql, args: [1] });
+            await expect(
+                c.execute({ sql, args: [1] }),
+            ).rejects.toBeLibsqlError();
+
+            const rs = await c.execute({ sql, args: [2] });
+            expect(rs.rowsAffected).toStrictEqual(1);
+        }),
+    );
+
     (hasHrana2 ? test : test.skip)(
         "rowsAffected with WITH INSERT",
         withClient(async (c) => {
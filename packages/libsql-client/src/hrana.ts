@@ -54,6 +54,7 @@ export abstract class HranaTransaction implements Transaction {
 
                 this._getSqlCache().apply(hranaStmts);
                 const batch = stream.batch(this.#version >= 3);
+                const inTxnCond = inTransactionCond(this.#version, batch);
                 const beginStep = batch.step();
                 const beginPromise = beginStep.run(
                     transactionModeToBegin(this.#mode),
@@ -66,17 +67,13 @@ export abstract class HranaTransaction implements Transaction {
                     const stmtStep = batch
                         .step()
                         .condition(hrana.BatchCond.ok(lastStep));
-                    if (this.#version >= 3) {
+                    if (inTxnCond !== undefined) {
                         // If the Hrana version supports it, make sure that we are still in a transaction
-                        stmtStep.condition(
-                            hrana.BatchCond.not(
-                                hrana.BatchCond.isAutocommit(batch),
-                            ),
-                        );
+                        stmtStep.condition(inTxnCond);
                     }
 
                     const rowsPromise = stmtStep.query(hranaStmt);
-                    rowsPromise.catch(() => undefined); // silence Node warning
+                    rowsPromise.catch(ignoreError); // silence Node warning
                     lastStep = stmtStep;
                     return rowsPromise;
                 });
@@ -109,6 +106,7 @@ export abstract class HranaTransaction implements Transaction {
 
                 this._getSqlCache().apply(hranaStmts);
                 const batch = stream.batch(this.#version >= 3);
+                const inTxnCond = inTransactionCond(this.#version, batch);
 
                 let lastStep: hrana.BatchStep | undefined = undefined;
                 rowsPromises = hranaStmts.map((hranaStmt) => {
@@ -116,15 +114,11 @@ export abstract class HranaTransaction implements Transaction {
                     if (lastStep !== undefined) {
                         stmtStep.condition(hrana.BatchCond.ok(lastStep));
                     }
-                    if (this.#version >= 3) {
-                        stmtStep.condition(
-                            hrana.BatchCond.not(
-                                hrana.BatchCond.isAutocommit(batch),
-                            ),
-                        );
+                    if (inTxnCond !== undefined) {
+                        stmtStep.condition(inTxnCond);
                     }
                     const rowsPromise = stmtStep.query(hranaStmt);
-                    rowsPromise.catch(() => undefined); // silence Node warning
+                    rowsPromise.catch(ignoreError); // silence Node warning
                     lastStep = stmtStep;
                     return rowsPromise;
                 });
@@ -255,14 +249,13 @@ export async function executeHranaBatch(
 ): Promise<Array<ResultSet>> {
     const beginStep = batch.step();
     const beginPromise = beginStep.run(transactionModeToBegin(mode));
+    const inTxnCond = inTransactionCond(version, batch);
 
     let lastStep = beginStep;
     const stmtPromises = hranaStmts.map((hranaStmt) => {
         const stmtStep = batch.step().condition(hrana.BatchCond.ok(lastStep));
-        if (version >= 3) {
-            stmtStep.condition(
-                hrana.BatchCond.not(hrana.BatchCond.isAutocommit(batch)),
-            );
+        if (inTxnCond !== undefined) {
+            stmtStep.condition(inTxnCond);
         }
 
         const stmtPromise = stmtStep.query(hranaStmt);
@@ -271,17 +264,15 @@ export async function executeHranaBatch(
     });
 
     const commitStep = batch.step().condition(hrana.BatchCond.ok(lastStep));
-    if (version >= 3) {
-        commitStep.condition(
-            hrana.BatchCond.not(hrana.BatchCond.isAutocommit(batch)),
-        );
+    if (inTxnCond !== undefined) {
+        commitStep.condition(inTxnCond);
     }
     const commitPromise = commitStep.run("COMMIT");
 
     const rollbackStep = batch
         .step()
         .condition(hrana.BatchCond.not(hrana.BatchCond.ok(commitStep)));
-    rollbackStep.run("ROLLBACK").catch((_) => undefined);
+    rollbackStep.run("ROLLBACK").catch(ignoreError);
 
     await batch.execute();
 
@@ -302,6 +293,25 @@ export async function executeHranaBatch(
     return resultSets;
 }
 
+// Returns a condition that holds only while the stream is in a transaction, or `undefined` if the Hrana
+// version does not support it. Conditions are immutable, so a single one is built per batch and shared by all
+// of its steps.
+function inTransactionCond(
+    version: hrana.ProtocolVersion,
+    batch: hrana.Batch,
+): hrana.BatchCond | undefined {
+    if (version < 3) {
+        return undefined;
+    }
+    return hrana.BatchCond.not(hrana.BatchCond.isAutocommit(batch));
+}
+
+// Rejection handler for promises whose errors we either handle later or deliberately ignore. Statements in a
+// batch attach it to every step, so we share a single function instead of allocating a closure each time.
+function ignoreError(_e: unknown): undefined {
+    return undefined;
+}
+
 export function stmtToHrana(stmt: InStatement): hrana.Stmt {
     if (typeof stmt === "string") {
         return new hrana.Stmt(stmt);
@@ -324,10 +334,7 @@ export function resultSetFromHrana(hranaRows: hrana.RowsResult): ResultSet {
     const columnTypes = hranaRows.columnDecltypes.map((c) => c ?? "");
     const rows = hranaRows.rows;
     const rowsAffected = hranaRows.affectedRowCount;
-    const lastInsertRowid =
-        hranaRows.lastInsertRowid !== undefined
-            ? hranaRows.lastInsertRowid
-            : undefined;
+    const lastInsertRowid = hranaRows.lastInsertRowid;
     return new ResultSetImpl(
         columns,
         columnTypes,
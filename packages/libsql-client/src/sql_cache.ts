@@ -1,4 +1,5 @@
 import type * as hrana from "@libsql/hrana-client";
+import { Lru } from "@libsql/core/util";
 
 export class SqlCache {
     #owner: hrana.SqlOwner;
@@ -63,42 +64,3 @@ export class SqlCache {
         }
     }
 }
-
-class Lru<K, V> {
-    // This maps keys to the cache values. The entries are ordered by their last use (entires that were used
-    // most recently are at the end).
-    #cache: Map<K, V>;
-
-    constructor() {
-        this.#cache = new Map();
-    }
-
-    get(key: K): V | undefined {
-        const value = this.#cache.get(key);
-        if (value !== undefined) {
-            // move the entry to the back of the Map
-            this.#cache.delete(key);
-            this.#cache.set(key, value);
-        }
-        return value;
-    }
-
-    set(key: K, value: V): void {
-        this.#cache.set(key, value);
-    }
-
-    peekLru(): [K, V] | undefined {
-        for (const entry of this.#cache.entries()) {
-            return entry;
-        }
-        return undefined;
-    }
-
-    delete(key: K): void {
-        this.#cache.delete(key);
-    }
-
-    get size(): number {
-        return this.#cache.size;
-    }
-}
@@ -20,7 +20,10 @@ import {
     supportedUrlLink,
     transactionModeToBegin,
     ResultSetImpl,
+    intFromSqlForMode,
+    Lru,
 } from "@libsql/core/util";
+import type { IntFromSql } from "@libsql/core/util";
 
 export * from "@libsql/core/api";
 
@@ -163,6 +166,8 @@ export class Sqlite3Client implements Client {
     close(): void {
         this.closed = true;
         if (this.#db !== null) {
+            // drop the cached statements together with the connection
+            stmtCaches.delete(this.#db);
             this.#db.close();
         }
     }
@@ -269,26 +274,18 @@ function executeStmt(
     }
 
     try {
-        const sqlStmt = db.prepare(sql);
-        sqlStmt.safeIntegers(true);
-
-        let returnsData = true;
-        try {
-            sqlStmt.raw(true);
-        } catch {
-            // raw() throws an exception if the statement does not return data
-            returnsData = false;
-        }
+        const { sqlStmt, returnsData } = prepareStmt(db, sql, args);
 
         if (returnsData) {
-            const columns = Array.from(
-                sqlStmt.columns().map((col) => col.name),
-            );
-            const columnTypes = Array.from(
-                sqlStmt.columns().map((col) => col.type ?? ""),
-            );
-            const rows = sqlStmt.all(args).map((sqlRow) => {
-                return rowFromSql(sqlRow as Array<unknown>, columns, intMode);
+            const sqlRows = sqlStmt.all(args) as Array<Array<unknown>>;
+            // A cached statement is recompiled by SQLite when the schema changes, so we must read the columns
+            // only after the statement has been executed.
+            const sqlColumns = sqlStmt.columns();
+            const columns = sqlColumns.map((col) => col.name);
+            const columnTypes = sqlColumns.map((col) => col.type ?? "");
+            const intFromSql = intFromSqlForMode(intMode);
+            const rows = sqlRows.map((sqlRow) => {
+                return rowFromSql(sqlRow, columns, intFromSql);
             });
             // TODO: can we get this info from better-sqlite3?
             const rowsAffected = 0;
@@ -307,60 +304,124 @@ function executeStmt(
             return new ResultSetImpl([], [], [], rowsAffected, lastInsertRowid);
         }
     } catch (e) {
+        // do not reuse a statement whose execution failed, prepare it again on the next execution
+        uncacheStmt(db, sql);
         throw mapSqliteError(e);
     }
 }
 
+type Statement = ReturnType<Database.Database["prepare"]>;
+
+interface CachedStmt {
+    sqlStmt: Statement;
+    // Whether the statement returns data. Probing this throws an exception for statements that don't, so we do
+    // it only once, when the statement is prepared.
+    returnsData: boolean;
+}
+
+// Prepared statements of every database connection, keyed by the SQL text. Preparing a statement parses and
+// plans the SQL, which dominates the cost of executing short statements, so we reuse the prepared statement
+// when the same SQL is executed again on the same connection.
+//
+// libsql binds only the arguments that are passed and keeps the other bindings of a reused statement, so every
+// SQL text maps to one statement per shape of the arguments (the number of positional arguments, or the names
+// of the named arguments). Otherwise, a value from a previous call could leak into a parameter that is left
+// unbound (and must be NULL).
+const stmtCaches: WeakMap<
+    Database.Database,
+    Lru<string, Map<number | string, CachedStmt>>
+> = new WeakMap();
+const stmtCacheCapacity = 100;
+
+function prepareStmt(
+    db: Database.Database,
+    sql: string,
+    args: Array<unknown> | Record<string, unknown>,
+): CachedStmt {
+    let stmtCache = stmtCaches.get(db);
+    if (stmtCache === undefined) {
+        stmtCache = new Lru();
+        stmtCaches.set(db, stmtCache);
+    }
+
+    let sqlStmts = stmtCache.get(sql);
+    if (sqlStmts === undefined) {
+        sqlStmts = new Map();
+        while (stmtCache.size + 1 > stmtCacheCapacity) {
+            const [evictSql] = stmtCache.peekLru()!;
+            stmtCache.delete(evictSql);
+        }
+        stmtCache.set(sql, sqlStmts);
+    }
+
+    // parameter names cannot contain a NUL character, so the joined names are unambiguous
+    const argsShape = Array.isArray(args)
+        ? args.length
+        : Object.keys(args).join("\0");
+    let cached = sqlStmts.get(argsShape);
+    if (cached === undefined) {
+        const sqlStmt = db.prepare(sql);
+        sqlStmt.safeIntegers(true);
+
+        let returnsData = true;
+        try {
+            sqlStmt.raw(true);
+        } catch {
+            // raw() throws an exception if the statement does not return data
+            returnsData = false;
+        }
+
+        cached = { sqlStmt, returnsData };
+        sqlStmts.set(argsShape, cached);
+    }
+    return cached;
+}
+
+function uncacheStmt(db: Database.Database, sql: string): void {
+    stmtCaches.get(db)?.delete(sql);
+}
+
 function rowFromSql(
     sqlRow: Array<unknown>,
     columns: Array<string>,
-    intMode: IntMode,
+    intFromSql: IntFromSql,
 ): Row {
     const row = {};
     // make sure that the "length" property is not enumerable
     Object.defineProperty(row, "length", { value: sqlRow.length });
+
+    // defineProperty() reads the descriptor when it is called, so we can reuse the same descriptor objects for
+    // all values in the row instead of allocating two of them for every value
+    const indexDesc: PropertyDescriptor = { value: undefined };
+    const columnDesc: PropertyDescriptor = {
+        value: undefined,
+        enumerable: true,
+        configurable: true,
+        writable: true,
+    };
     for (let i = 0; i < sqlRow.length; ++i) {
-        const value = valueFromSql(sqlRow[i], intMode);
-        Object.defineProperty(row, i, { value });
+        const value = valueFromSql(sqlRow[i], intFromSql);
+        indexDesc.value = value;
+        Object.defineProperty(row, i, indexDesc);
 
         const column = columns[i];
         if (!Object.hasOwn(row, column)) {
-            Object.defineProperty(row, column, {
-                value,
-                enumerable: true,
-                configurable: true,
-                writable: true,
-            });
+            columnDesc.value = value;
+            Object.defineProperty(row, column, columnDesc);
         }
     }
     return row as Row;
 }
 
-function valueFromSql(sqlValue: unknown, intMode: IntMode): Value {
+function valueFromSql(sqlValue: unknown, intFromSql: IntFromSql): Value {
     if (typeof sqlValue === "bigint") {
-        if (intMode === "number") {
-            if (sqlValue < minSafeBigint || sqlValue > maxSafeBigint) {
-                throw new RangeError(
-                    "Received integer which cannot be safely represented as a JavaScript number",
-                );
-            }
-            return Number(sqlValue);
-        } else if (intMode === "bigint") {
-            return sqlValue;
-        } else if (intMode === "string") {
-            return "" + sqlValue;
-        } else {
-            throw new Error("Invalid value for IntMode");
-        }
+        return intFromSql(sqlValue);
     } else if (sqlValue instanceof Buffer) {
         return sqlValue.buffer;
     }
     return sqlValue as Value;
 }
 
-const minSafeBigint = -9007199254740991n;
-const maxSafeBigint = 9007199254740991n;
-
 function valueToSql(value: InValue, intMode: IntMode): unknown {
     if (typeof value === "number") {
         if (!Number.isFinite(value)) {
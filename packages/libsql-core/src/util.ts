@@ -3,6 +3,7 @@ import {
     ResultSet,
     Row,
     Value,
+    IntMode,
     TransactionMode,
     InStatement,
     LibsqlError,
@@ -61,7 +62,13 @@ export class ResultSetImpl implements ResultSet {
 }
 
 function rowToJson(row: Row): unknown {
-    return Array.prototype.map.call(row, valueToJson);
+    // rows are array-like objects, so fill a preallocated array instead of going through the generic
+    // `Array.prototype.map`
+    const json = new Array(row.length);
+    for (let i = 0; i < row.length; ++i) {
+        json[i] = valueToJson(row[i]);
+    }
+    return json;
 }
 
 function valueToJson(value: Value): unknown {
@@ -73,3 +80,78 @@ function valueToJson(value: Value): unknown {
         return value;
     }
 }
+
+// Converts SQLite integers to JavaScript values. The conversion depends only on the `IntMode`, so the local
+// clients select it once per statement instead of checking the `IntMode` for every value.
+export type IntFromSql = (sqlInt: bigint) => Value;
+
+export function intFromSqlForMode(intMode: IntMode): IntFromSql {
+    if (intMode === "number") {
+        return intToNumber;
+    } else if (intMode === "bigint") {
+        return intToBigint;
+    } else if (intMode === "string") {
+        return intToString;
+    } else {
+        throw new Error("Invalid value for IntMode");
+    }
+}
+
+function intToNumber(sqlInt: bigint): Value {
+    // An integer converts to a safe number exactly if it is in the safe range, and to a number outside of that
+    // range otherwise, so we can check the converted number instead of comparing bigints
+    const value = Number(sqlInt);
+    if (!Number.isSafeInteger(value)) {
+        throw new RangeError(
+            "Received integer which cannot be safely represented as a JavaScript number",
+        );
+    }
+    return value;
+}
+
+function intToBigint(sqlInt: bigint): Value {
+    return sqlInt;
+}
+
+function intToString(sqlInt: bigint): Value {
+    return "" + sqlInt;
+}
+
+export class Lru<K, V> {
+    // This maps keys to the cache values. The entries are ordered by their last use (entires that were used
+    // most recently are at the end).
+    #cache: Map<K, V>;
+
+    constructor() {
+        this.#cache = new Map();
+    }
+
+    get(key: K): V | undefined {
+        const value = this.#cache.get(key);
+        if (value !== undefined) {
+            // move the entry to the back of the Map
+            this.#cache.delete(key);
+            this.#cache.set(key, value);
+        }
+        return value;
+    }
+
+    set(key: K, value: V): void {
+        this.#cache.set(key, value);
+    }
+
+    peekLru(): [K, V] | undefined {
+        for (const entry of this.#cache.entries()) {
+            return entry;
+        }
+        return undefined;
+    }
+
+    delete(key: K): void {
+        this.#cache.delete(key);
+    }
+
+    get size(): number {
+        return this.#cache.size;
+    }
+}